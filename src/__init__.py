@@ -3,9 +3,12 @@ Uni Gzip - A unified Python library for reading and writing gzip-compressed JSON
 
 This package provides utilities for:
 - Reading gzip-compressed JSON files
-- Writing data to gzip-compressed JSON files
-- Reading gzip-compressed text files
+- Streaming objects out of large gzip-compressed JSON files
+- Writing data (or pre-serialized JSON bytes) to gzip-compressed JSON files
+- Reading gzip-compressed text files (as str or raw bytes)
 - Writing text content to gzip-compressed files
+- Reading and writing many gzip-compressed JSON files concurrently
+- Reading and writing zstd- or LZ4-compressed JSON files, selected by extension
 - Compressing JSON and text to bytes in memory
 - Automatic UTF-8 encoding handling
 - Compact JSON format for efficient storage
@@ -14,7 +17,7 @@ This package provides utilities for:
 import logging
 
 from .exceptions import UniGzipError, UniGzipJsonError, UniGzipJsonReadError, UniGzipJsonWriteError, UniGzipTxtError, UniGzipTxtReadError, UniGzipTxtWriteError
-from .uni_gzip import compressJSON, compressTxt, readJsonGz, readTxtGz, writeJsonGz, writeTxtGz
+from .uni_gzip import compressJSON, compressTxt, readJsonArchive, readJsonGz, readJsonGzMany, readJsonGzStream, readTxtGz, readTxtGzBytes, writeJsonArchive, writeJsonGz, writeJsonGzFromBytes, writeJsonGzMany, writeTxtGz
 
 __version__ = "1.1.0"
 
@@ -26,9 +29,16 @@ logger.addHandler(logging.NullHandler())
 
 __all__ = [
     "readJsonGz",
+    "readJsonGzStream",
+    "readJsonGzMany",
     "writeJsonGz",
+    "writeJsonGzFromBytes",
+    "writeJsonGzMany",
     "readTxtGz",
+    "readTxtGzBytes",
     "writeTxtGz",
+    "readJsonArchive",
+    "writeJsonArchive",
     "compressJSON",
     "compressTxt",
     "UniGzipError",
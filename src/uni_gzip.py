@@ -7,84 +7,826 @@ All operations use UTF-8 encoding. JSON files use compact format (no spaces, no
 """
 
 import gzip
+import io
 import json
 import logging
+import mmap
+import os
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Iterable
-
-from .exceptions import UniGzipJsonReadError, UniGzipJsonWriteError, UniGzipTxtReadError, UniGzipTxtWriteError
+from typing import Any, Iterable, Iterator
+
+from .exceptions import UniGzipError, UniGzipJsonReadError, UniGzipJsonWriteError, UniGzipTxtReadError, UniGzipTxtWriteError
+
+try:
+    # zlib-ng is a drop-in replacement for the gzip module with SIMD-accelerated
+    # deflate/inflate and CRC32, accepting the same 0-9 compression levels.
+    from zlib_ng import gzip_ng as _gzip
+    from zlib_ng import zlib_ng as _zlib
+except ImportError:  # pragma: no cover - optional dependency
+    _gzip = gzip
+    _zlib = zlib
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    # ijson picks its fastest available backend (yajl2_c when compiled) automatically
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for reading the compressed file. Before Python 3.12 the gzip reader
+# pulls io.DEFAULT_BUFFER_SIZE (8 KiB) chunks from its file object, so an unbuffered
+# or default-buffered file costs one read() syscall per 8 KiB of compressed input.
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Ordered (exception type, message template) tables used to translate errors into
+# uni-gzip exceptions. The first matching entry wins, so subclasses come before
+# their bases and the final Exception entry catches everything else.
+_READ_JSON_ERRORS = (
+    (FileNotFoundError, "File not found: {path}"),
+    (gzip.BadGzipFile, "Invalid gzip format: {path}"),
+    # Truncated files, and with zlib-ng also short non-gzip files
+    (EOFError, "Invalid gzip format: {path}: {error}"),
+    (json.JSONDecodeError, "JSON parsing error in {path}: {error}"),
+    (OSError, "I/O error reading {path}: {error}"),
+    (Exception, "Unexpected error reading {path}: {error}"),
+)
+_READ_JSON_STREAM_ERRORS = _READ_JSON_ERRORS if ijson is None else ((ijson.JSONError, "JSON parsing error in {path}: {error}"),) + _READ_JSON_ERRORS
+_READ_JSON_ARCHIVE_ERRORS = (
+    (() if zstandard is None else ((zstandard.ZstdError, "Invalid zstd format: {path}: {error}"),))
+    # lz4.frame reports corrupt frames as RuntimeError and truncated ones as EOFError
+    + (() if lz4_frame is None else (((RuntimeError, EOFError), "Invalid lz4 format: {path}: {error}"),))
+    + _READ_JSON_ERRORS
+)
+_READ_TXT_ERRORS = (
+    (FileNotFoundError, "File not found: {path}"),
+    (gzip.BadGzipFile, "Invalid gzip format: {path}"),
+    # Truncated files, and with zlib-ng also short non-gzip files
+    (EOFError, "Invalid gzip format: {path}: {error}"),
+    (UnicodeDecodeError, "Encoding error reading {path}: {error}"),
+    (OSError, "I/O error reading {path}: {error}"),
+    (Exception, "Unexpected error reading {path}: {error}"),
+)
+_WRITE_ERRORS = (
+    (PermissionError, "Permission denied writing to {path}"),
+    (OSError, "I/O error writing to {path}: {error}"),
+    (Exception, "Unexpected error writing to {path}: {error}"),
+)
+
+# orjson limits: integers it reads and writes exactly, and maximum nesting depth.
+_ORJSON_MIN_INT = -(2**63)
+_ORJSON_MAX_INT = 2**64 - 1
+_ORJSON_MAX_DEPTH = 254
+
+# Exact types orjson writes as the stdlib encoder does (floats are checked by value).
+_ORJSON_SCALAR_TYPES = frozenset((str, int, bool, type(None)))
+_ORJSON_CONTAINER_TYPES = frozenset((dict, list, tuple))
+
+# Float magnitudes repr() writes without an exponent. Outside this range the stdlib
+# writes exponents as e+16/e-05 while orjson writes e16 or plain decimals (0.00001).
+_PLAIN_FLOAT_MIN = 1e-4
+_PLAIN_FLOAT_MAX = 1e16
+
+# Translation table used to find integer tokens outside orjson's exact range: ASCII
+# digits and b"-" map to b"0", the bytes that can precede fraction and exponent
+# digits (b".", b"e", b"E", b"+") to b"x", and everything else to b" ". Every integer
+# above 2**64 - 1 has 20+ digits and every one below -(2**63) a sign and 19+ digits,
+# so only runs of 20+ b"0" after a separator need a closer look.
+_NUMBER_MASK = bytes(0x30 if 0x30 <= i <= 0x39 or i == 0x2D else 0x78 if i in b".eE+" else 0x20 for i in range(256))
+_WIDE_INT_MARKER = b" " + b"0" * 20
+_INT_TOKEN = re.compile(rb"-?\d+(?![.eE\d])")
+
+# Default compression levels for writeJsonArchive, per codec.
+_ZSTD_DEFAULT_LEVEL = 3
+_LZ4_DEFAULT_LEVEL = 0
+
+# Upper bound on the gzip header (including file name and comment) parsed when
+# skipping checksum verification; longer headers take the verifying path.
+_MAX_HEADER_SIZE = 4096
+
+# Files below this size are read into memory with one read() call; mapping them
+# costs more than copying them.
+_SMALL_FILE_SIZE = 1024 * 1024
+
+# Files up to this size are memory-mapped and inflated in a single call; larger
+# files are streamed so they do not reserve a huge virtual address range.
+_MMAP_MAX_SIZE = 1024 * 1024 * 1024
+
+# Size of the compressed slices fed to zlib for the second and later members of an
+# in-memory gzip file. This bounds the input zlib copies into unused_data at the end
+# of each member.
+_INFLATE_BLOCK_SIZE = 1024 * 1024
+
+# Size of the encoded batches handed to the compressor when writing text from an iterable.
+_WRITE_BATCH_SIZE = 1024 * 1024
+
+# Size of the independently compressed blocks used by parallel writes.
+_PARALLEL_CHUNK_SIZE = 1024 * 1024
+
+
+def _wrap_error(error_class: type[UniGzipError], table: tuple, path_str: str, error: Exception) -> UniGzipError:
+    """
+    Build the uni-gzip exception for an error using the first matching table entry.
+
+    Every table ends with an Exception entry, so the loop always matches.
+    """
+    for exc_type, template in table:
+        if isinstance(error, exc_type):
+            break
+    return error_class(template.format(path=path_str, error=error), file_path=path_str)
+
+
+def _path_str(path: str | bytes | Path, error_class: type[UniGzipError]) -> str:
+    """
+    Convert a path argument to str, raising error_class if it is not a path.
+
+    Bytes paths are decoded with the filesystem encoding so that error messages
+    show the file name rather than a b'...' literal.
+    """
+    try:
+        return os.fsdecode(path)
+    except TypeError as e:
+        raise error_class(f"Invalid path: {path!r}", file_path=None) from e
+
+
+def _check_compresslevel(compresslevel: int) -> None:
+    """
+    Reject gzip compression levels outside 0-9 before any file is opened.
+
+    zlib only reports them once compression starts, as a bare "Bad compression
+    level" error (or ValueError on the streaming path), after the output file
+    has already been created.
+    """
+    if not 0 <= compresslevel <= 9:
+        raise ValueError(f"compresslevel must be from 0 to 9, got {compresslevel!r}")
+
+
+@contextmanager
+def _open_gz_bytes(path_str: str) -> Iterator[gzip.GzipFile]:
+    """
+    Open a gzip file for binary reading over a 128 KiB buffered file.
+
+    Consumers that want bytes (JSON parsers, raw reads) read from the returned
+    GzipFile directly, without a text decoding layer on top.
+    """
+    with open(path_str, "rb", buffering=_READ_BUFFER_SIZE) as raw, _gzip.GzipFile(fileobj=raw) as f:
+        if hasattr(os, "posix_fadvise"):
+            # The readahead hint is best effort: pipes and FIFOs reject it with ESPIPE
+            try:
+                os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        yield f
+
+
+def _gzip_header_size(buffer: bytes | memoryview) -> int | None:
+    """
+    Return the length of the gzip member header at the start of buffer.
+
+    Returns None if the buffer does not start with a deflate gzip header, or if
+    the header's optional fields run past _MAX_HEADER_SIZE.
+    """
+    head = bytes(buffer[:_MAX_HEADER_SIZE])
+    if len(head) < 10 or head[:3] != b"\x1f\x8b\x08":
+        return None
+    flags = head[3]
+    pos = 10
+    if flags & gzip.FEXTRA:
+        pos += 2 + int.from_bytes(head[pos : pos + 2], "little")
+    for flag in (gzip.FNAME, gzip.FCOMMENT):
+        if flags & flag:
+            end = head.find(b"\0", pos)
+            if end < 0:
+                return None
+            pos = end + 1
+    if flags & gzip.FHCRC:
+        pos += 2
+    return pos if pos <= len(head) else None
+
+
+def _skip_zero_padding(view: memoryview, pos: int) -> int:
+    """
+    Return the offset of the first non-zero byte at or after pos.
+
+    gzip files may be padded with zero bytes after (and between) members.
+    """
+    while pos < len(view):
+        block = view[pos : pos + _MAX_HEADER_SIZE].tobytes()
+        stripped = block.lstrip(b"\0")
+        pos += len(block) - len(stripped)
+        if stripped:
+            break
+    return pos
+
+
+def _inflate_members(buffer: bytes | mmap.mmap, verify_checksum: bool = True) -> bytes | None:
+    """
+    Inflate every gzip member in an in-memory buffer.
+
+    The first member is inflated from the whole buffer in one zlib call, so a
+    single-member file costs one call and its output needs no join. In exchange,
+    when the first member ends early, zlib copies the rest of the buffer into
+    unused_data once. Later members are fed in _INFLATE_BLOCK_SIZE slices of a
+    memoryview, which bounds that copy to one slice per member. Zero padding
+    after a member is skipped, like GzipFile does. The memoryview and its slices
+    are released before returning, even on error, so the caller can close an
+    mmap buffer.
+
+    By default zlib parses each gzip header and verifies the CRC32 and size
+    itself. With verify_checksum=False the header is skipped here, the body is
+    inflated as raw deflate, so no CRC32 is computed over the output, and the
+    trailer is ignored. Returns None when the buffer is not a sequence of
+    complete, valid members so the caller can fall back to GzipFile.
+    """
+    with memoryview(buffer) as view:
+        size = len(view)
+        chunks = []
+        pos = 0
+        block_size = size
+        while pos < size:
+            if verify_checksum:
+                decompressor = _zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+            else:
+                header_size = _gzip_header_size(view[pos : pos + _MAX_HEADER_SIZE].tobytes())
+                if header_size is None:
+                    return None
+                pos += header_size
+                decompressor = _zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+            while not decompressor.eof:
+                if pos >= size:
+                    return None
+                with view[pos : pos + block_size] as block:
+                    try:
+                        chunks.append(decompressor.decompress(block))
+                    except _zlib.error:
+                        return None
+                    pos += len(block)
+            pos -= len(decompressor.unused_data)
+            block_size = _INFLATE_BLOCK_SIZE
+            if not verify_checksum:
+                if size - pos < 8:
+                    return None
+                pos += 8
+            pos = _skip_zero_padding(view, pos)
+    return b"".join(chunks)
+
+
+def _read_gz_all(path_str: str, verify_checksum: bool = True) -> bytes:
+    """
+    Read and decompress a whole gzip file.
+
+    Files below _SMALL_FILE_SIZE are read with a single read() call, which is
+    cheaper than setting up a mapping for them. Files up to _MMAP_MAX_SIZE are
+    memory-mapped so zlib inflates the mapped pages directly, instead of the
+    file being read into a buffer first. Both paths handle multi-member and
+    zero-padded files; for a multi-member file, the compressed data after the
+    first member is copied once (see _inflate_members).
+    Anything they do not cover (empty or larger files, corrupt input) is read
+    through GzipFile, which also produces the usual gzip exceptions.
+
+    verify_checksum=False skips the CRC32/size check on the in-memory paths only;
+    the GzipFile fallback always verifies.
+    """
+    data = None
+    with open(path_str, "rb", buffering=0) as raw:
+        size = os.fstat(raw.fileno()).st_size
+        if 0 < size < _SMALL_FILE_SIZE:
+            data = _inflate_members(raw.read(), verify_checksum)
+        elif 0 < size <= _MMAP_MAX_SIZE:
+            with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                data = _inflate_members(mm, verify_checksum)
+    if data is not None:
+        return data
+
+    with _open_gz_bytes(path_str) as f:
+        return f.read()
+
+
+def _drop_page_cache(f: io.BufferedIOBase) -> None:
+    """
+    Write a just-written file through to disk and drop its pages from the page cache.
+
+    POSIX_FADV_DONTNEED only evicts clean pages; pages still dirty or under
+    writeback are skipped. The data is therefore synced with fdatasync first,
+    which blocks until it is on disk, so that the advice evicts the whole file.
+    A no-op where posix_fadvise is unavailable (Windows, macOS).
+    """
+    if hasattr(os, "posix_fadvise"):
+        f.flush()
+        os.fdatasync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _write_gz_bytes(path_str: str, data: bytes, compresslevel: int, threads: int = 1, drop_cache: bool = False) -> None:
+    """
+    Compress a complete payload in one shot and write it to a gzip file.
+
+    For payloads already held in memory this skips the GzipFile and
+    BufferedWriter layers and their per-call setup, which dominate the cost
+    of writing small files.
+
+    With threads > 1, payloads larger than one block are split into
+    _PARALLEL_CHUNK_SIZE blocks compressed concurrently (zlib releases the GIL)
+    and written as consecutive gzip members, which standard readers decompress
+    as a single stream (RFC 1952).
+
+    With drop_cache, the written file is evicted from the page cache afterwards.
+    """
+    if threads > 1 and len(data) > _PARALLEL_CHUNK_SIZE:
+        view = memoryview(data)
+        chunks = [view[i : i + _PARALLEL_CHUNK_SIZE] for i in range(0, len(view), _PARALLEL_CHUNK_SIZE)]
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            members = executor.map(lambda chunk: _gzip.compress(chunk, compresslevel=compresslevel, mtime=0), chunks)
+            with open(path_str, "wb") as f:
+                for member in members:
+                    f.write(member)
+                if drop_cache:
+                    _drop_page_cache(f)
+        return
+
+    payload = _gzip.compress(data, compresslevel=compresslevel)
+    with open(path_str, "wb") as f:
+        f.write(payload)
+        if drop_cache:
+            _drop_page_cache(f)
+
+
+def _archive_codec(path_str: str) -> str:
+    """
+    Select the compression codec for an archive path from its extension.
+
+    ``.zst``/``.zstd`` map to zstd and ``.lz4`` to LZ4 frames; anything else is
+    treated as gzip so existing files keep working.
+    """
+    suffix = os.path.splitext(path_str)[1].lower()
+    if suffix in (".zst", ".zstd"):
+        if zstandard is None:
+            raise ImportError(f"Reading or writing {suffix} files requires the 'zstandard' package (pip install zstandard)")
+        return "zstd"
+    if suffix == ".lz4":
+        if lz4_frame is None:
+            raise ImportError("Reading or writing .lz4 files requires the 'lz4' package (pip install lz4)")
+        return "lz4"
+    return "gzip"
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    """
+    Decompress every concatenated zstd frame in data.
 
-def readJsonGz(path: str | Path) -> Any:
+    Decompression objects also handle frames written without a content size.
+    Unlike stream_reader, which returns whatever it decoded so far, this raises
+    ZstdError when the input ends inside a frame.
+    """
+    decompressor = zstandard.ZstdDecompressor()
+    chunks = []
+    while True:
+        frame = decompressor.decompressobj()
+        chunks.append(frame.decompress(data))
+        if not frame.eof:
+            raise zstandard.ZstdError("compressed data ended before the end of the frame")
+        data = frame.unused_data
+        if not data:
+            return b"".join(chunks)
+
+
+def _is_orjson_exact(data: Any) -> bool:
+    """
+    Check whether orjson serializes data exactly as the stdlib encoder would.
+
+    True only for trees of plain dict, list, tuple, str, int, bool, None and
+    finite floats that repr() writes without an exponent. Anything else
+    (NaN/Infinity, floats such as 1e16 or 1e-05, datetime, UUID, Enum,
+    dataclasses, subclasses) goes to the stdlib encoder, which writes the values
+    as before or raises TypeError.
+
+    Dict keys, integer ranges and nesting depth are left to orjson itself: it
+    raises JSONEncodeError for non-str keys, integers outside 64 bits and trees
+    deeper than its recursion limit, and _dumps_json then falls back. The depth
+    bound here only stops the walk on self-referencing containers.
+    """
+    stack = [((data,), 0)]
+    while stack:
+        container, depth = stack.pop()
+        if depth > _ORJSON_MAX_DEPTH:
+            return False
+        for value in container.values() if type(container) is dict else container:
+            value_type = type(value)
+            if value_type in _ORJSON_SCALAR_TYPES:
+                continue
+            if value_type is float:
+                # Also rejects NaN and Infinity, which fail every comparison here
+                if not (_PLAIN_FLOAT_MIN <= value < _PLAIN_FLOAT_MAX or -_PLAIN_FLOAT_MAX < value <= -_PLAIN_FLOAT_MIN or value == 0.0):
+                    return False
+            elif value_type in _ORJSON_CONTAINER_TYPES:
+                stack.append((value, depth + 1))
+            else:
+                return False
+    return True
+
+
+def _reject_non_json(value: Any) -> Any:
+    """
+    orjson ``default`` hook: refuse every type the stdlib encoder would refuse.
+    """
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _has_wide_int(data: bytes) -> bool:
+    """
+    Check whether JSON bytes may contain an integer outside orjson's 64-bit range.
+
+    The masked copy lets one bytes.find skip straight to long integer tokens;
+    fraction and exponent digits, unsigned 19-digit IDs and shorter numbers
+    never match.
+    Each candidate is parsed and compared with the range. Digits inside strings
+    can only cause a false positive, which just costs a stdlib parse.
+    """
+    masked = data.translate(_NUMBER_MASK)
+    pos = masked.find(_WIDE_INT_MARKER)
+    while pos >= 0:
+        if _is_wide_int_at(data, pos + 1):
+            return True
+        pos = masked.find(_WIDE_INT_MARKER, pos + len(_WIDE_INT_MARKER))
+    # A bare top-level integer has no separator in front of it
+    return _is_wide_int_at(data, 0)
+
+
+def _is_wide_int_at(data: bytes, pos: int) -> bool:
+    """
+    Check whether an integer token outside orjson's 64-bit range starts at pos.
+    """
+    token = _INT_TOKEN.match(data, pos)
+    if token is None:
+        return False
+    digits = token.group()
+    # Skip int() for very long tokens, which it refuses to convert past 4300 digits
+    return len(digits) > 21 or not _ORJSON_MIN_INT <= int(digits) <= _ORJSON_MAX_INT
+
+
+def _loads_json(data: bytes) -> Any:
+    """
+    Parse UTF-8 encoded JSON bytes, using orjson when it parses them exactly.
+
+    orjson reads integers wider than 64 bits as floats and rejects NaN/Infinity,
+    both of which the stdlib parser (and the stdlib encoder) handle. Documents
+    that may hold such an integer, and anything orjson refuses, are parsed with
+    the stdlib json module instead.
+    """
+    if orjson is not None and not _has_wide_int(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to compact UTF-8 encoded JSON bytes, using orjson when it is exact.
+
+    Both paths produce compact JSON without ASCII escaping. orjson is only used
+    for data that passes _is_orjson_exact; everything else is serialized by the
+    stdlib encoder, which raises TypeError for non-serializable data.
+    """
+    if orjson is not None and _is_orjson_exact(data):
+        try:
+            return orjson.dumps(
+                data,
+                default=_reject_non_json,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def readJsonGz(path: str | Path, verify_checksum: bool = True) -> Any:
     """
     Read a gzip-compressed JSON file.
 
-    Opens the file in text mode with UTF-8 encoding, decompresses it,
-    and parses the JSON content.
+    Opens the file in binary mode, decompresses it, and parses the UTF-8
+    encoded JSON bytes directly (with orjson when installed).
 
     Args:
         path: Path to the gzip-compressed JSON file (str or Path).
+        verify_checksum: Verify the gzip CRC32 and size trailer (default). Pass
+            False for trusted inputs (e.g. internal caches with their own integrity
+            checks) to skip the CRC32 pass over the decompressed data. Files over
+            1 GiB, files with a gzip header longer than 4 KiB and pipes are read
+            through GzipFile and always verified.
 
     Returns:
         Parsed JSON data (dict, list, or other JSON-serializable types).
 
     Raises:
         UniGzipJsonReadError: If reading fails due to:
+            - Invalid path (not a str, bytes or os.PathLike)
             - File not found
             - Invalid gzip format
             - JSON parsing errors
             - I/O errors
     """
-    path_str = str(path)
+    path_str = _path_str(path, UniGzipJsonReadError)
+    try:
+        return _loads_json(_read_gz_all(path_str, verify_checksum))
+    except Exception as e:
+        raise _wrap_error(UniGzipJsonReadError, _READ_JSON_ERRORS, path_str, e) from e
+
+
+def _iter_json_gz_items(path_str: str, prefix: str) -> Iterator[Any]:
+    """
+    Yield the objects under ``prefix`` from a gzip-compressed JSON file.
+
+    Only errors raised while opening, decompressing or parsing the file are
+    wrapped; exceptions the consumer throws into the generator at a yield
+    propagate unchanged.
+    """
+    in_consumer = False
     try:
-        with gzip.open(path_str, "rt", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError as e:
-        raise UniGzipJsonReadError(f"File not found: {path_str}", file_path=path_str) from e
-    except gzip.BadGzipFile as e:
-        raise UniGzipJsonReadError(f"Invalid gzip format: {path_str}", file_path=path_str) from e
-    except json.JSONDecodeError as e:
-        raise UniGzipJsonReadError(f"JSON parsing error in {path_str}: {e}", file_path=path_str) from e
-    except OSError as e:
-        raise UniGzipJsonReadError(f"I/O error reading {path_str}: {e}", file_path=path_str) from e
+        with _open_gz_bytes(path_str) as f:
+            for item in ijson.items(f, prefix, use_float=True):
+                in_consumer = True
+                yield item
+                in_consumer = False
     except Exception as e:
-        raise UniGzipJsonReadError(f"Unexpected error reading {path_str}: {e}", file_path=path_str) from e
+        if in_consumer:
+            raise
+        raise _wrap_error(UniGzipJsonReadError, _READ_JSON_STREAM_ERRORS, path_str, e) from e
+
+
+def readJsonGzStream(path: str | Path, prefix: str = "item") -> Iterator[Any]:
+    """
+    Incrementally read objects from a gzip-compressed JSON file.
+
+    Decompresses and parses the file in small chunks, yielding each object found
+    under ``prefix`` as soon as it is complete. Peak memory stays bounded by the
+    largest yielded object instead of the whole document, which makes this the
+    preferred reader for files larger than ~100 MB. Requires the optional
+    ``ijson`` package.
+
+    The file is opened on the first ``next()`` call, so errors reading it are
+    raised while iterating rather than by this call.
+
+    Args:
+        path: Path to the gzip-compressed JSON file (str or Path).
+        prefix: ijson prefix selecting the objects to yield. The default ``"item"``
+            yields each element of a top-level array.
+
+    Returns:
+        An iterator over the parsed JSON objects found under ``prefix``.
+
+    Raises:
+        ImportError: If ijson is not installed.
+        UniGzipJsonReadError: If the path is invalid (not a str, bytes or
+            os.PathLike), or, while iterating, if reading fails due to:
+            - File not found
+            - Invalid gzip format
+            - JSON parsing errors (including truncated documents)
+            - I/O errors
+    """
+    if ijson is None:
+        raise ImportError("readJsonGzStream requires the 'ijson' package (pip install ijson)")
+    return _iter_json_gz_items(_path_str(path, UniGzipJsonReadError), prefix)
 
 
-def writeJsonGz(path: str | Path, data: Any) -> None:
+def writeJsonGz(path: str | Path, data: Any, compresslevel: int = 1, threads: int = 1, drop_cache: bool = False) -> None:
     """
     Write data to a gzip-compressed JSON file.
 
-    Serializes the data to JSON and writes it as a gzip-compressed file
-    in text mode with UTF-8 encoding. Uses compact JSON format (no spaces,
-    no ASCII escaping) for efficient storage.
+    Serializes the data to UTF-8 encoded JSON bytes (with orjson when installed)
+    and writes them as a gzip-compressed file. Uses compact JSON format
+    (no spaces, no ASCII escaping) for efficient storage.
 
     Args:
         path: Path to the output file (str or Path).
         data: Data to serialize (must be JSON-serializable).
+        compresslevel: gzip compression level from 0 (none) to 9 (smallest).
+            Defaults to 1, the fastest level; use 6 or higher for archival files
+            where size matters more than write speed.
+        threads: Number of threads used to compress payloads larger than 1 MiB.
+            With more than one thread the payload is compressed as independent
+            1 MiB gzip members, which any gzip reader decompresses transparently.
+        drop_cache: Sync the written file to disk (fdatasync) and evict it from
+            the OS page cache (Linux only, ignored elsewhere). Useful for bulk
+            writes of files that will not be read back soon, so they do not
+            displace hotter data; the sync makes each write wait for the disk.
 
     Raises:
         UniGzipJsonWriteError: If writing fails due to:
+            - Invalid path (not a str, bytes or os.PathLike)
             - Permission denied
             - Disk space issues
             - I/O errors
         TypeError: If data is not JSON-serializable.
+        ValueError: If compresslevel is not from 0 to 9.
     """
-    path_str = str(path)
+    path_str = _path_str(path, UniGzipJsonWriteError)
+    _check_compresslevel(compresslevel)
     try:
-        with gzip.open(path_str, "wt", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
-    except PermissionError as e:
-        raise UniGzipJsonWriteError(f"Permission denied writing to {path_str}", file_path=path_str) from e
-    except OSError as e:
-        raise UniGzipJsonWriteError(f"I/O error writing to {path_str}: {e}", file_path=path_str) from e
+        _write_gz_bytes(path_str, _dumps_json(data), compresslevel, threads, drop_cache)
     except TypeError as e:
         # Re-raise TypeError for non-serializable data (not wrapped in UniGzipJsonWriteError)
         raise
     except Exception as e:
-        raise UniGzipJsonWriteError(f"Unexpected error writing to {path_str}: {e}", file_path=path_str) from e
+        raise _wrap_error(UniGzipJsonWriteError, _WRITE_ERRORS, path_str, e) from e
+
+
+def writeJsonGzFromBytes(path: str | Path, data: bytes, compresslevel: int = 1, threads: int = 1, drop_cache: bool = False) -> None:
+    """
+    Write already-serialized JSON bytes to a gzip-compressed file.
+
+    Compresses the payload as-is, without parsing or re-serializing it. Useful
+    for pipeline stages that only gzip-wrap a JSON blob obtained elsewhere
+    (a cache, a database, a previous orjson.dumps call). The payload is not
+    validated; it should be UTF-8 encoded JSON for readJsonGz to read it back.
+
+    Args:
+        path: Path to the output file (str or Path).
+        data: Serialized JSON as bytes (or any bytes-like object).
+        compresslevel: gzip compression level from 0 (none) to 9 (smallest).
+            Defaults to 1, the fastest level.
+        threads: Number of threads used to compress payloads larger than 1 MiB,
+            as in writeJsonGz.
+        drop_cache: Evict the written file from the OS page cache, as in writeJsonGz.
+
+    Raises:
+        UniGzipJsonWriteError: If writing fails due to:
+            - Invalid path (not a str, bytes or os.PathLike)
+            - Permission denied
+            - Disk space issues
+            - I/O errors
+        TypeError: If data is not a bytes-like object.
+        ValueError: If compresslevel is not from 0 to 9.
+    """
+    path_str = _path_str(path, UniGzipJsonWriteError)
+    _check_compresslevel(compresslevel)
+    try:
+        _write_gz_bytes(path_str, data, compresslevel, threads, drop_cache)
+    except TypeError as e:
+        # Re-raise TypeError for non-bytes data (not wrapped in UniGzipJsonWriteError)
+        raise
+    except Exception as e:
+        raise _wrap_error(UniGzipJsonWriteError, _WRITE_ERRORS, path_str, e) from e
+
+
+def readJsonGzMany(paths: Iterable[str | Path], max_workers: int | None = None, verify_checksum: bool = True) -> list[Any]:
+    """
+    Read many gzip-compressed JSON files concurrently.
+
+    Runs readJsonGz for each path on a thread pool. Decompression releases the
+    GIL, so this is the recommended way to process a directory of .json.gz files.
+
+    Args:
+        paths: Paths to the gzip-compressed JSON files (str or Path).
+        max_workers: Maximum number of threads (ThreadPoolExecutor default when None).
+        verify_checksum: Verify the gzip CRC32 and size trailer of each file, as
+            in readJsonGz.
+
+    Returns:
+        Parsed JSON data for each path, in the same order as paths.
+
+    Raises:
+        UniGzipJsonReadError: If reading any of the files fails (the first failure
+            in input order is raised).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: readJsonGz(path, verify_checksum), paths))
+
+
+def writeJsonGzMany(items: Iterable[tuple[str | Path, Any]], compresslevel: int = 1, max_workers: int | None = None, drop_cache: bool = False, threads: int = 1) -> None:
+    """
+    Write many gzip-compressed JSON files concurrently.
+
+    Runs writeJsonGz for each (path, data) pair on a thread pool. Compression
+    releases the GIL, so independent files are written in parallel.
+
+    Args:
+        items: (path, data) pairs to write.
+        compresslevel: gzip compression level from 0 (none) to 9 (smallest).
+            Defaults to 1, the fastest level.
+        max_workers: Maximum number of threads (ThreadPoolExecutor default when None).
+        drop_cache: Evict each written file from the OS page cache, as in writeJsonGz.
+        threads: Number of threads used to compress each payload larger than 1 MiB,
+            as in writeJsonGz. These run on top of the max_workers file writers.
+
+    Raises:
+        UniGzipJsonWriteError: If writing any of the files fails (the first failure
+            in input order is raised).
+        TypeError: If any data is not JSON-serializable.
+        ValueError: If compresslevel is not from 0 to 9.
+    """
+    _check_compresslevel(compresslevel)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(lambda item: writeJsonGz(item[0], item[1], compresslevel, threads, drop_cache), items):
+            pass
+
+
+def readJsonArchive(path: str | Path) -> Any:
+    """
+    Read a compressed JSON file, selecting the codec from the file extension.
+
+    ``.zst``/``.zstd`` files are decompressed with zstd, ``.lz4`` files as LZ4
+    frames, and every other path is read as gzip via readJsonGz.
+
+    Args:
+        path: Path to the compressed JSON file (str or Path).
+
+    Returns:
+        Parsed JSON data (dict, list, or other JSON-serializable types).
+
+    Raises:
+        ImportError: If the codec's optional package is not installed.
+        UniGzipJsonReadError: If reading fails due to:
+            - Invalid path (not a str, bytes or os.PathLike)
+            - File not found
+            - Invalid compressed format
+            - JSON parsing errors
+            - I/O errors
+    """
+    path_str = _path_str(path, UniGzipJsonReadError)
+    codec = _archive_codec(path_str)
+    if codec == "gzip":
+        return readJsonGz(path_str)
+    try:
+        with open(path_str, "rb") as f:
+            if codec == "zstd":
+                data = _zstd_decompress(f.read())
+            else:
+                # LZ4FrameFile reads every concatenated frame, lz4.frame.decompress only the first
+                with lz4_frame.LZ4FrameFile(f) as reader:
+                    data = reader.read()
+        return _loads_json(data)
+    except Exception as e:
+        raise _wrap_error(UniGzipJsonReadError, _READ_JSON_ARCHIVE_ERRORS, path_str, e) from e
+
+
+def writeJsonArchive(path: str | Path, data: Any, compresslevel: int | None = None) -> None:
+    """
+    Write data to a compressed JSON file, selecting the codec from the file extension.
+
+    ``.zst``/``.zstd`` files are compressed with zstd (multi-threaded, level 3 by
+    default), ``.lz4`` files as LZ4 frames (level 0 by default), and every other
+    path is written as gzip via writeJsonGz (level 1 by default). zstd level 3
+    is both faster and smaller than gzip for typical JSON, so prefer ``.zst`` for
+    new files that do not need to be read by gzip-only consumers.
+
+    Args:
+        path: Path to the output file (str or Path).
+        data: Data to serialize (must be JSON-serializable).
+        compresslevel: Codec-specific compression level, or None for the codec default.
+
+    Raises:
+        ImportError: If the codec's optional package is not installed.
+        UniGzipJsonWriteError: If writing fails due to:
+            - Invalid path (not a str, bytes or os.PathLike)
+            - Permission denied
+            - Disk space issues
+            - I/O errors
+        TypeError: If data is not JSON-serializable.
+        ValueError: If compresslevel is not from 0 to 9 for a gzip path.
+    """
+    path_str = _path_str(path, UniGzipJsonWriteError)
+    codec = _archive_codec(path_str)
+    if codec == "gzip":
+        writeJsonGz(path_str, data, 1 if compresslevel is None else compresslevel)
+        return
+    try:
+        data_bytes = _dumps_json(data)
+        if codec == "zstd":
+            level = _ZSTD_DEFAULT_LEVEL if compresslevel is None else compresslevel
+            payload = zstandard.ZstdCompressor(level=level, threads=-1).compress(data_bytes)
+        else:
+            level = _LZ4_DEFAULT_LEVEL if compresslevel is None else compresslevel
+            payload = lz4_frame.compress(data_bytes, compression_level=level)
+        with open(path_str, "wb") as f:
+            f.write(payload)
+    except TypeError as e:
+        # Re-raise TypeError for non-serializable data (not wrapped in UniGzipJsonWriteError)
+        raise
+    except Exception as e:
+        raise _wrap_error(UniGzipJsonWriteError, _WRITE_ERRORS, path_str, e) from e
 
 
 def compressJSON(data: Any) -> bytes:
@@ -104,14 +846,13 @@ def compressJSON(data: Any) -> bytes:
         TypeError: If data is not JSON-serializable.
     """
     try:
-        json_str = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
-        return gzip.compress(json_str.encode("utf-8"))
+        return _gzip.compress(_dumps_json(data))
     except TypeError:
         # Re-raise TypeError for non-serializable data
         raise
 
 
-def readTxtGz(path: str | Path) -> str:
+def readTxtGz(path: str | Path, verify_checksum: bool = True) -> str:
     """
     Read a gzip-compressed text file.
 
@@ -120,38 +861,60 @@ def readTxtGz(path: str | Path) -> str:
 
     Args:
         path: Path to the gzip-compressed text file (str or Path).
+        verify_checksum: Verify the gzip CRC32 and size trailer (default), as in readJsonGz.
 
     Returns:
         Text content as a string.
 
     Raises:
         UniGzipTxtReadError: If reading fails due to:
+            - Invalid path (not a str, bytes or os.PathLike)
             - File not found
             - Invalid gzip format
             - Encoding errors
             - I/O errors
     """
-    path_str = str(path)
+    path_str = _path_str(path, UniGzipTxtReadError)
+    try:
+        return io.TextIOWrapper(io.BytesIO(_read_gz_all(path_str, verify_checksum)), encoding="utf-8").read()
+    except Exception as e:
+        raise _wrap_error(UniGzipTxtReadError, _READ_TXT_ERRORS, path_str, e) from e
+
+
+def readTxtGzBytes(path: str | Path, verify_checksum: bool = True) -> bytes:
+    """
+    Read a gzip-compressed text file as raw bytes.
+
+    Decompresses the file without decoding it, skipping UTF-8 validation and
+    str allocation. Prefer this over readTxtGz when the consumer accepts bytes
+    (hashing, byte-level regex search, re-compressing elsewhere).
+
+    Args:
+        path: Path to the gzip-compressed text file (str or Path).
+        verify_checksum: Verify the gzip CRC32 and size trailer (default), as in readJsonGz.
+
+    Returns:
+        Decompressed content as bytes.
+
+    Raises:
+        UniGzipTxtReadError: If reading fails due to:
+            - Invalid path (not a str, bytes or os.PathLike)
+            - File not found
+            - Invalid gzip format
+            - I/O errors
+    """
+    path_str = _path_str(path, UniGzipTxtReadError)
     try:
-        with gzip.open(path_str, "rt", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError as e:
-        raise UniGzipTxtReadError(f"File not found: {path_str}", file_path=path_str) from e
-    except gzip.BadGzipFile as e:
-        raise UniGzipTxtReadError(f"Invalid gzip format: {path_str}", file_path=path_str) from e
-    except UnicodeDecodeError as e:
-        raise UniGzipTxtReadError(f"Encoding error reading {path_str}: {e}", file_path=path_str) from e
-    except OSError as e:
-        raise UniGzipTxtReadError(f"I/O error reading {path_str}: {e}", file_path=path_str) from e
+        return _read_gz_all(path_str, verify_checksum)
     except Exception as e:
-        raise UniGzipTxtReadError(f"Unexpected error reading {path_str}: {e}", file_path=path_str) from e
+        raise _wrap_error(UniGzipTxtReadError, _READ_TXT_ERRORS, path_str, e) from e
 
 
-def writeTxtGz(path: str | Path, content: str | Iterable[str]) -> None:
+def writeTxtGz(path: str | Path, content: str | Iterable[str], compresslevel: int = 1, drop_cache: bool = False) -> None:
     """
     Write content to a gzip-compressed text file.
 
-    Writes the content as a gzip-compressed file in text mode with UTF-8 encoding.
+    Encodes the content as UTF-8 and writes it as a gzip-compressed file.
     If content is a string, it is written as-is. If content is an iterable of strings,
     each string is written as a line (no newline is added automatically).
 
@@ -160,35 +923,60 @@ def writeTxtGz(path: str | Path, content: str | Iterable[str]) -> None:
         content: Text content to write. Can be:
             - A string: written as-is
             - An iterable of strings: each string is written as a line
+        compresslevel: gzip compression level from 0 (none) to 9 (smallest).
+            Defaults to 1, the fastest level; use 6 or higher for archival files
+            where size matters more than write speed.
+        drop_cache: Sync the written file to disk (fdatasync) and evict it from
+            the OS page cache (Linux only, ignored elsewhere). Useful for bulk
+            writes of files that will not be read back soon, so they do not
+            displace hotter data; the sync makes each write wait for the disk.
 
     Raises:
         UniGzipTxtWriteError: If writing fails due to:
+            - Invalid path (not a str, bytes or os.PathLike)
             - Permission denied
             - Disk space issues
             - I/O errors
         TypeError: If content is not a string or iterable of strings.
+        ValueError: If compresslevel is not from 0 to 9.
     """
-    path_str = str(path)
+    path_str = _path_str(path, UniGzipTxtWriteError)
+    _check_compresslevel(compresslevel)
     try:
-        with gzip.open(path_str, "wt", encoding="utf-8") as f:
-            if isinstance(content, str):
-                f.write(content)
-            else:
-                # content is an iterable of strings
-                try:
-                    for line in content:
-                        f.write(line)
-                except TypeError:
-                    raise TypeError(f"content must be a string or iterable of strings, got {type(content).__name__}")
-    except PermissionError as e:
-        raise UniGzipTxtWriteError(f"Permission denied writing to {path_str}", file_path=path_str) from e
-    except OSError as e:
-        raise UniGzipTxtWriteError(f"I/O error writing to {path_str}: {e}", file_path=path_str) from e
+        if isinstance(content, str):
+            _write_gz_bytes(path_str, content.encode("utf-8"), compresslevel, drop_cache=drop_cache)
+        elif isinstance(content, (list, tuple)):
+            # Join in one pass so deflate sees a single buffer instead of one write per line
+            try:
+                full_content = "".join(content)
+            except TypeError:
+                raise TypeError(f"content must be a string or iterable of strings, got {type(content).__name__}")
+            _write_gz_bytes(path_str, full_content.encode("utf-8"), compresslevel, drop_cache=drop_cache)
+        else:
+            # content is an arbitrary iterable of strings: encode lines into batches
+            # of ~_WRITE_BATCH_SIZE bytes so each gzip write covers many lines
+            try:
+                lines = iter(content)
+            except TypeError:
+                raise TypeError(f"content must be a string or iterable of strings, got {type(content).__name__}")
+            with open(path_str, "wb") as raw:
+                with _gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=compresslevel) as f:
+                    batch = bytearray()
+                    for line in lines:
+                        if not isinstance(line, str):
+                            raise TypeError(f"content must be a string or iterable of strings, got {type(content).__name__}")
+                        batch += line.encode("utf-8")
+                        if len(batch) >= _WRITE_BATCH_SIZE:
+                            f.write(batch)
+                            batch.clear()
+                    f.write(batch)
+                if drop_cache:
+                    _drop_page_cache(raw)
     except TypeError as e:
         # Re-raise TypeError for invalid content type (not wrapped in UniGzipTxtWriteError)
         raise
     except Exception as e:
-        raise UniGzipTxtWriteError(f"Unexpected error writing to {path_str}: {e}", file_path=path_str) from e
+        raise _wrap_error(UniGzipTxtWriteError, _WRITE_ERRORS, path_str, e) from e
 
 
 def compressTxt(content: str | Iterable[str]) -> bytes:
@@ -207,11 +995,11 @@ def compressTxt(content: str | Iterable[str]) -> bytes:
         TypeError: If content is not a string or iterable of strings.
     """
     if isinstance(content, str):
-        return gzip.compress(content.encode("utf-8"))
+        return _gzip.compress(content.encode("utf-8"))
 
     # content is an iterable of strings
     try:
         full_content = "".join(content)
-        return gzip.compress(full_content.encode("utf-8"))
+        return _gzip.compress(full_content.encode("utf-8"))
     except TypeError:
         raise TypeError(f"content must be a string or iterable of strings, got {type(content).__name__}")
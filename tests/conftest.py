@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the uni-gzip tests.
+"""
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+
+
+@pytest.fixture
+def fallback_calls(monkeypatch):
+    """Record every path read through the GzipFile fallback."""
+    calls = []
+    open_gz_bytes = uni_gzip_module._open_gz_bytes
+
+    def spy(path_str):
+        calls.append(path_str)
+        return open_gz_bytes(path_str)
+
+    monkeypatch.setattr(uni_gzip_module, "_open_gz_bytes", spy)
+    return calls
@@ -0,0 +1,79 @@
+"""
+Tests for readJsonArchive and writeJsonArchive across the supported codecs.
+"""
+
+import gzip
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+from uni_gzip import UniGzipJsonReadError, readJsonArchive, readJsonGz, writeJsonArchive
+
+DATA = {"records": [{"id": i, "name": f"record {i}", "score": i / 4} for i in range(1000)]}
+
+requires_zstd = pytest.mark.skipif(uni_gzip_module.zstandard is None, reason="requires zstandard")
+requires_lz4 = pytest.mark.skipif(uni_gzip_module.lz4_frame is None, reason="requires lz4")
+
+
+def _compress(codec, payload):
+    if codec == "zstd":
+        return uni_gzip_module.zstandard.ZstdCompressor().compress(payload)
+    return uni_gzip_module.lz4_frame.compress(payload)
+
+
+@pytest.mark.parametrize(
+    "suffix",
+    [".json.gz", pytest.param(".zst", marks=requires_zstd), pytest.param(".zstd", marks=requires_zstd), pytest.param(".lz4", marks=requires_lz4)],
+)
+@pytest.mark.parametrize("compresslevel", [None, 1])
+def test_roundtrip(tmp_path, suffix, compresslevel):
+    path = tmp_path / f"data{suffix}"
+    writeJsonArchive(path, DATA, compresslevel=compresslevel)
+    assert readJsonArchive(path) == DATA
+
+
+def test_gzip_archive_is_readable_by_readJsonGz(tmp_path):
+    path = tmp_path / "data.json.gz"
+    writeJsonArchive(path, DATA)
+    assert readJsonGz(path) == DATA
+
+
+@pytest.mark.parametrize("codec, suffix", [pytest.param("zstd", ".zst", marks=requires_zstd), pytest.param("lz4", ".lz4", marks=requires_lz4)])
+def test_concatenated_frames(tmp_path, codec, suffix):
+    path = tmp_path / f"data{suffix}"
+    path.write_bytes(_compress(codec, b'{"a":[1,') + _compress(codec, b"2]}"))
+    assert readJsonArchive(path) == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "suffix, corrupt, message",
+    [
+        pytest.param(".zst", lambda payload: b"not a zstd frame", "Invalid zstd format", marks=requires_zstd),
+        pytest.param(".zst", lambda payload: payload[:-5], "Invalid zstd format", marks=requires_zstd),
+        pytest.param(".lz4", lambda payload: b"not an lz4 frame", "Invalid lz4 format", marks=requires_lz4),
+        pytest.param(".lz4", lambda payload: payload[:-5], "Invalid lz4 format", marks=requires_lz4),
+        (".json.gz", lambda payload: b"not a gzip file", "Invalid gzip format"),
+    ],
+    ids=["zstd-garbage", "zstd-truncated", "lz4-garbage", "lz4-truncated", "gzip-garbage"],
+)
+def test_corrupt_file(tmp_path, suffix, corrupt, message):
+    path = tmp_path / f"data{suffix}"
+    writeJsonArchive(path, DATA)
+    path.write_bytes(corrupt(path.read_bytes()))
+    with pytest.raises(UniGzipJsonReadError, match=message):
+        readJsonArchive(path)
+
+
+@pytest.mark.parametrize("suffix", [pytest.param(".zst", marks=requires_zstd), pytest.param(".lz4", marks=requires_lz4)])
+def test_missing_file(tmp_path, suffix):
+    with pytest.raises(UniGzipJsonReadError, match="File not found"):
+        readJsonArchive(tmp_path / f"missing{suffix}")
+
+
+@pytest.mark.parametrize("suffix, module", [(".zst", "zstandard"), (".lz4", "lz4_frame")])
+def test_missing_codec_package(tmp_path, monkeypatch, suffix, module):
+    monkeypatch.setattr(uni_gzip_module, module, None)
+    with pytest.raises(ImportError):
+        writeJsonArchive(tmp_path / f"data{suffix}", DATA)
+    with pytest.raises(ImportError):
+        readJsonArchive(tmp_path / f"data{suffix}")
@@ -0,0 +1,146 @@
+"""
+Round-trip tests for the JSON read/write paths, with and without orjson.
+"""
+
+import dataclasses
+import datetime
+import enum
+import gzip
+import json
+import math
+import uuid
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+from uni_gzip import compressJSON, readJsonGz, writeJsonGz
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+@dataclasses.dataclass
+class Point:
+    x: int = 1
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        if uni_gzip_module.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(uni_gzip_module, "orjson", None)
+    return request.param
+
+
+def _roundtrip(tmp_path, data):
+    path = tmp_path / "data.json.gz"
+    writeJsonGz(path, data)
+    return readJsonGz(path)
+
+
+def test_roundtrip_plain_data(tmp_path, json_backend):
+    data = {"str": "héllo", "int": 42, "float": 1.5, "bool": True, "none": None, "list": [1, [2, {"a": 3}]]}
+    assert _roundtrip(tmp_path, data) == data
+
+
+def _assert_matches_stdlib(tmp_path, data):
+    expected = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    path = tmp_path / "data.json.gz"
+    writeJsonGz(path, data)
+    with gzip.open(path, "rb") as f:
+        assert f.read() == expected
+    assert gzip.decompress(compressJSON(data)) == expected
+
+
+def test_output_matches_stdlib_encoder(tmp_path, json_backend):
+    data = {
+        "b": [1, -(2**63), 2**64 - 1, 2.5, -0.0, 1e-4, -9.999e15, 0.1 + 0.2, "é", "\u2028\x7f\x00"],
+        "a": {"nested": None, "flag": False},
+        "t": (1, "tuple"),
+    }
+    # The orjson backend must actually take the orjson path for this data
+    assert uni_gzip_module._is_orjson_exact(data)
+    _assert_matches_stdlib(tmp_path, data)
+
+
+def test_output_with_int_keys_matches_stdlib_encoder(tmp_path, json_backend):
+    _assert_matches_stdlib(tmp_path, {"a": 1, 1: "int key", 2.5: "float key", None: "null key"})
+
+
+@pytest.mark.parametrize("value", [1e16, -1e16, 1.5e300, 1e-5, -1e-7, 5e-324, 9.999999999999999e-05])
+def test_exponent_floats_match_stdlib_encoder(tmp_path, json_backend, value):
+    assert not uni_gzip_module._is_orjson_exact([value])
+    _assert_matches_stdlib(tmp_path, {"value": value, "list": [1.5, value]})
+
+
+def test_roundtrip_non_finite_floats(tmp_path, json_backend):
+    result = _roundtrip(tmp_path, {"nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")})
+    assert math.isnan(result["nan"])
+    assert result["inf"] == float("inf")
+    assert result["ninf"] == float("-inf")
+
+
+@pytest.mark.parametrize("value", [2**70, -(2**70), 2**64 - 1, 2**64, -(2**63), -(2**63) - 1, 10**19])
+def test_roundtrip_wide_integers(tmp_path, json_backend, value):
+    result = _roundtrip(tmp_path, {"value": value})
+    assert type(result["value"]) is int
+    assert result["value"] == value
+
+
+def test_read_nan_written_by_stdlib(tmp_path, json_backend):
+    path = tmp_path / "nan.json.gz"
+    path.write_bytes(gzip.compress(b'{"a":NaN,"b":Infinity}'))
+    result = readJsonGz(path)
+    assert math.isnan(result["a"])
+    assert result["b"] == float("inf")
+
+
+def test_long_digit_strings_are_not_numbers(tmp_path, json_backend):
+    data = {"id": "123456789012345678901234567890"}
+    assert _roundtrip(tmp_path, data) == data
+
+
+@pytest.mark.parametrize("value", [datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 1), uuid.UUID(int=1), Color.RED, Point(), object()])
+def test_non_json_types_raise_type_error(tmp_path, json_backend, value):
+    with pytest.raises(TypeError):
+        writeJsonGz(tmp_path / "data.json.gz", {"value": value})
+    with pytest.raises(TypeError):
+        compressJSON([value])
+
+
+def test_deep_nesting_falls_back_to_stdlib(tmp_path, json_backend):
+    data = []
+    inner = data
+    for _ in range(300):
+        inner.append([])
+        inner = inner[0]
+    assert _roundtrip(tmp_path, data) == data
+
+
+@pytest.mark.parametrize(
+    "data, wide",
+    [
+        (b"[1234567890123456789,9999999999999999999]", False),
+        (b"[0.0012345678901234567,1.12345678901234567890123]", False),
+        (b"[18446744073709551615,-9223372036854775808]", False),
+        (b"[12345678901234567890.5,1e-12345678901234567890]", False),
+        (b"5", False),
+        (b'{"a":18446744073709551616}', True),
+        (b"[1,-9223372036854775809]", True),
+        (b"18446744073709551616", True),
+        (b"[" + b"9" * 5000 + b"]", True),
+        (b'["id 123456789012345678901"]', True),
+    ],
+)
+def test_wide_int_detection(data, wide):
+    assert uni_gzip_module._has_wide_int(data) is wide
+
+
+@pytest.mark.parametrize("text", ["18446744073709551616", "-9223372036854775809", " [1, 123456789012345678901234567890]"])
+def test_read_wide_integers(tmp_path, json_backend, text):
+    path = tmp_path / "wide.json.gz"
+    path.write_bytes(gzip.compress(text.encode("ascii")))
+    assert readJsonGz(path) == json.loads(text)
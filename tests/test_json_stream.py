@@ -0,0 +1,61 @@
+"""
+Tests for readJsonGzStream.
+"""
+
+import gzip
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+from uni_gzip import UniGzipJsonReadError, UniGzipTxtReadError, readJsonGzStream, writeJsonGz
+
+pytest.importorskip("ijson")
+
+
+def test_stream_items(tmp_path):
+    path = tmp_path / "records.json.gz"
+    records = [{"id": i, "value": i * 0.5} for i in range(100)]
+    writeJsonGz(path, records)
+
+    assert list(readJsonGzStream(path)) == records
+
+
+def test_missing_ijson_raises_at_call_time(monkeypatch, tmp_path):
+    monkeypatch.setattr(uni_gzip_module, "ijson", None)
+
+    with pytest.raises(ImportError, match="ijson"):
+        readJsonGzStream(tmp_path / "records.json.gz")
+
+
+def test_read_errors_are_wrapped(tmp_path):
+    with pytest.raises(UniGzipJsonReadError, match="File not found"):
+        next(readJsonGzStream(tmp_path / "missing.json.gz"))
+
+    path = tmp_path / "truncated.json.gz"
+    path.write_bytes(gzip.compress(b'[{"id":1},{"id":'))
+    stream = readJsonGzStream(path)
+    assert next(stream) == {"id": 1}
+    with pytest.raises(UniGzipJsonReadError):
+        next(stream)
+
+
+@pytest.mark.parametrize("thrown", [ValueError("consumer"), UniGzipTxtReadError("consumer")])
+def test_thrown_exceptions_are_not_wrapped(tmp_path, thrown):
+    path = tmp_path / "records.json.gz"
+    writeJsonGz(path, [1, 2, 3])
+
+    stream = readJsonGzStream(path)
+    assert next(stream) == 1
+    with pytest.raises(type(thrown)) as exc_info:
+        stream.throw(thrown)
+    assert exc_info.value is thrown
+
+
+def test_close_before_end(tmp_path):
+    path = tmp_path / "records.json.gz"
+    writeJsonGz(path, [1, 2, 3])
+
+    stream = readJsonGzStream(path)
+    assert next(stream) == 1
+    stream.close()
+    assert list(stream) == []
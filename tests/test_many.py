@@ -0,0 +1,98 @@
+"""
+Tests for the concurrent readJsonGzMany and writeJsonGzMany helpers.
+"""
+
+import gzip
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+from uni_gzip import UniGzipJsonReadError, UniGzipJsonWriteError, readJsonGz, readJsonGzMany, writeJsonGz, writeJsonGzMany
+
+
+def _corrupt_crc(path):
+    compressed = bytearray(path.read_bytes())
+    compressed[-8] ^= 0xFF
+    path.write_bytes(bytes(compressed))
+
+
+def test_read_many_preserves_input_order(tmp_path):
+    # Larger files first, so they tend to finish after the small ones
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"{i}.json.gz"
+        writeJsonGz(path, {"index": i, "values": list(range((20 - i) * 5000))})
+        paths.append(path)
+
+    results = readJsonGzMany(paths, max_workers=8)
+    assert [result["index"] for result in results] == list(range(20))
+
+
+def test_read_many_empty():
+    assert readJsonGzMany([]) == []
+
+
+def test_read_many_raises_first_failure_in_input_order(tmp_path):
+    good = tmp_path / "good.json.gz"
+    writeJsonGz(good, {"values": list(range(200000))})
+    corrupt = tmp_path / "corrupt.json.gz"
+    corrupt.write_bytes(b"this is not a gzip file")
+    missing = tmp_path / "missing.json.gz"
+
+    with pytest.raises(UniGzipJsonReadError, match="Invalid gzip format") as exc_info:
+        readJsonGzMany([good, corrupt, missing], max_workers=3)
+    assert exc_info.value.file_path == str(corrupt)
+
+    with pytest.raises(UniGzipJsonReadError, match="File not found") as exc_info:
+        readJsonGzMany([good, missing, corrupt], max_workers=3)
+    assert exc_info.value.file_path == str(missing)
+
+
+def test_read_many_forwards_verify_checksum(tmp_path):
+    path = tmp_path / "crc.json.gz"
+    writeJsonGz(path, {"a": 1})
+    _corrupt_crc(path)
+
+    with pytest.raises(UniGzipJsonReadError):
+        readJsonGzMany([path])
+    assert readJsonGzMany([path], verify_checksum=False) == [{"a": 1}]
+
+
+def test_write_many_roundtrip(tmp_path):
+    items = [(tmp_path / f"{i}.json.gz", {"index": i}) for i in range(20)]
+    writeJsonGzMany(items, max_workers=8)
+    assert readJsonGzMany([path for path, _ in items]) == [data for _, data in items]
+
+
+def test_write_many_forwards_options(tmp_path, monkeypatch):
+    calls = []
+    write_gz_bytes = uni_gzip_module._write_gz_bytes
+
+    def spy(path_str, data, compresslevel, threads=1, drop_cache=False):
+        calls.append((compresslevel, threads, drop_cache))
+        write_gz_bytes(path_str, data, compresslevel, threads, drop_cache)
+
+    monkeypatch.setattr(uni_gzip_module, "_write_gz_bytes", spy)
+    data = {"values": list(range(300000))}
+    path = tmp_path / "big.json.gz"
+    writeJsonGzMany([(path, data)], compresslevel=6, drop_cache=True, threads=2)
+
+    assert calls == [(6, 2, True)]
+    assert readJsonGz(path) == data
+    # threads=2 splits the >1 MiB payload into several gzip members
+    assert path.read_bytes().count(b"\x1f\x8b\x08") > 1
+
+
+def test_write_many_raises_first_failure_in_input_order(tmp_path):
+    missing_dir = tmp_path / "missing"
+    items = [
+        (tmp_path / "good.json.gz", {"a": 1}),
+        (missing_dir / "first.json.gz", {"a": 2}),
+        (missing_dir / "second.json.gz", {"a": 3}),
+    ]
+    with pytest.raises(UniGzipJsonWriteError) as exc_info:
+        writeJsonGzMany(items, max_workers=3)
+    assert exc_info.value.file_path == str(missing_dir / "first.json.gz")
+
+    with pytest.raises(TypeError):
+        writeJsonGzMany([(tmp_path / "bad.json.gz", {"a": object()})])
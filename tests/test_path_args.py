@@ -0,0 +1,65 @@
+"""
+Tests for the path argument types accepted by the public functions.
+"""
+
+import os
+
+import pytest
+
+from uni_gzip import (
+    UniGzipJsonReadError,
+    UniGzipJsonWriteError,
+    UniGzipTxtReadError,
+    UniGzipTxtWriteError,
+    readJsonArchive,
+    readJsonGz,
+    readJsonGzStream,
+    readTxtGz,
+    readTxtGzBytes,
+    writeJsonArchive,
+    writeJsonGz,
+    writeJsonGzFromBytes,
+    writeTxtGz,
+)
+
+READERS = [
+    (readJsonGz, UniGzipJsonReadError),
+    (lambda path: list(readJsonGzStream(path)), UniGzipJsonReadError),
+    (readJsonArchive, UniGzipJsonReadError),
+    (readTxtGz, UniGzipTxtReadError),
+    (readTxtGzBytes, UniGzipTxtReadError),
+]
+WRITERS = [
+    (lambda path: writeJsonGz(path, {"a": 1}), UniGzipJsonWriteError),
+    (lambda path: writeJsonGzFromBytes(path, b'{"a":1}'), UniGzipJsonWriteError),
+    (lambda path: writeJsonArchive(path, {"a": 1}), UniGzipJsonWriteError),
+    (lambda path: writeTxtGz(path, "a"), UniGzipTxtWriteError),
+]
+
+
+@pytest.mark.parametrize("func, error_class", READERS + WRITERS)
+@pytest.mark.parametrize("path", [None, 42])
+def test_invalid_path_is_wrapped(func, error_class, path):
+    with pytest.raises(error_class, match="Invalid path") as exc_info:
+        func(path)
+    assert isinstance(exc_info.value.__cause__, TypeError)
+    assert exc_info.value.file_path is None
+
+
+@pytest.mark.parametrize("func, error_class", READERS)
+def test_missing_bytes_path_message(tmp_path, func, error_class):
+    path = os.fsencode(tmp_path / "missing.json.gz")
+    with pytest.raises(error_class) as exc_info:
+        func(path)
+    assert exc_info.value.file_path == os.fsdecode(path)
+    assert "b'" not in str(exc_info.value)
+
+
+def test_bytes_path_roundtrip(tmp_path):
+    json_path = os.fsencode(tmp_path / "data.json.gz")
+    writeJsonGz(json_path, {"a": 1})
+    assert readJsonGz(json_path) == {"a": 1}
+
+    txt_path = os.fsencode(tmp_path / "data.txt.gz")
+    writeTxtGz(txt_path, "hello")
+    assert readTxtGz(txt_path) == "hello"
@@ -0,0 +1,44 @@
+"""
+Tests for the exceptions raised when reading invalid gzip files, with each gzip engine.
+"""
+
+import gzip
+import zlib
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+from uni_gzip import UniGzipJsonReadError, UniGzipTxtReadError, readJsonGz, readJsonGzStream, readTxtGz, readTxtGzBytes
+
+READERS = [
+    (readJsonGz, UniGzipJsonReadError),
+    pytest.param(
+        lambda path: list(readJsonGzStream(path)),
+        UniGzipJsonReadError,
+        marks=pytest.mark.skipif(uni_gzip_module.ijson is None, reason="requires ijson"),
+    ),
+    (readTxtGz, UniGzipTxtReadError),
+    (readTxtGzBytes, UniGzipTxtReadError),
+]
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def gzip_engine(request, monkeypatch):
+    """Run with the configured engine (zlib-ng when installed) and with the stdlib modules."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(uni_gzip_module, "_gzip", gzip)
+        monkeypatch.setattr(uni_gzip_module, "_zlib", zlib)
+    return request.param
+
+
+@pytest.mark.parametrize("read, error_class", READERS)
+@pytest.mark.parametrize(
+    "content",
+    [b"garbage", b"\x1f", b"\x1f\x8b\x08", b"this is not a gzip file", gzip.compress(b'["hello"]')[:-4], gzip.compress(b'["hello"]')[:15]],
+    ids=["short", "magic-byte", "header-start", "long", "truncated-trailer", "truncated-body"],
+)
+def test_invalid_gzip_file(tmp_path, gzip_engine, read, error_class, content):
+    path = tmp_path / "bad.gz"
+    path.write_bytes(content)
+    with pytest.raises(error_class, match="Invalid gzip format"):
+        read(path)
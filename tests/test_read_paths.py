@@ -0,0 +1,139 @@
+"""
+Tests for the in-memory read paths (single read() for small files, mmap for
+larger ones) and their GzipFile fallback.
+"""
+
+import gzip
+import os
+import threading
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+from uni_gzip import UniGzipTxtReadError, readJsonGz, readJsonGzStream, readTxtGz, readTxtGzBytes, writeJsonGz
+
+
+def _large_payload() -> bytes:
+    # Incompressible enough that the gzip file is well over the 1 MiB small-file limit
+    return os.urandom(3 * 1024 * 1024).hex().encode("ascii")
+
+
+@pytest.mark.parametrize("verify_checksum", [True, False])
+def test_large_multi_member_file_is_read_without_fallback(tmp_path, fallback_calls, verify_checksum):
+    data = [{"id": i, "blob": os.urandom(64).hex()} for i in range(40000)]
+    path = tmp_path / "multi.json.gz"
+    writeJsonGz(path, data, threads=4)
+    assert path.stat().st_size > uni_gzip_module._SMALL_FILE_SIZE
+
+    assert readJsonGz(path, verify_checksum=verify_checksum) == data
+    assert fallback_calls == []
+
+
+@pytest.mark.parametrize("verify_checksum", [True, False])
+def test_large_padded_file_is_read_without_fallback(tmp_path, fallback_calls, verify_checksum):
+    payload = _large_payload()
+    path = tmp_path / "padded.gz"
+    path.write_bytes(gzip.compress(payload[:1000]) + gzip.compress(payload[1000:]) + b"\0" * 10000)
+
+    assert readTxtGzBytes(path, verify_checksum=verify_checksum) == payload
+    assert fallback_calls == []
+
+
+def test_large_truncated_file_raises(tmp_path):
+    compressed = gzip.compress(_large_payload())
+    path = tmp_path / "truncated.gz"
+    path.write_bytes(compressed[:-100])
+
+    with pytest.raises(UniGzipTxtReadError):
+        readTxtGzBytes(path)
+
+
+@pytest.mark.parametrize("verify_checksum", [True, False])
+@pytest.mark.parametrize(
+    "compressed",
+    [
+        gzip.compress(b"hello ") + gzip.compress(b"world"),
+        gzip.compress(b"hello world") + b"\0" * 16,
+        gzip.compress(b"hello ") + b"\0\0" + gzip.compress(b"world") + b"\0",
+    ],
+    ids=["multi-member", "padded", "padded-between-members"],
+)
+def test_small_file_is_read_without_fallback(tmp_path, fallback_calls, compressed, verify_checksum):
+    path = tmp_path / "small.gz"
+    path.write_bytes(compressed)
+    assert path.stat().st_size < uni_gzip_module._SMALL_FILE_SIZE
+
+    assert readTxtGzBytes(path, verify_checksum=verify_checksum) == b"hello world"
+    assert fallback_calls == []
+
+
+def test_empty_file_reads_as_empty(tmp_path):
+    path = tmp_path / "empty.gz"
+    path.write_bytes(b"")
+
+    assert readTxtGzBytes(path) == b""
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+@pytest.mark.parametrize(
+    "read, expected",
+    [
+        (readTxtGz, '["hello"]'),
+        (readTxtGzBytes, b'["hello"]'),
+        (readJsonGz, ["hello"]),
+        pytest.param(
+            lambda path: list(readJsonGzStream(path)),
+            ["hello"],
+            marks=pytest.mark.skipif(uni_gzip_module.ijson is None, reason="requires ijson"),
+        ),
+    ],
+    ids=["readTxtGz", "readTxtGzBytes", "readJsonGz", "readJsonGzStream"],
+)
+def test_fifo_is_read_through_fallback(tmp_path, fallback_calls, read, expected):
+    path = tmp_path / "data.gz"
+    os.mkfifo(path)
+
+    def feed():
+        with open(path, "wb") as f:
+            f.write(gzip.compress(b'["hello"]'))
+
+    writer = threading.Thread(target=feed)
+    writer.start()
+    try:
+        assert read(path) == expected
+    finally:
+        writer.join()
+    assert fallback_calls == [str(path)]
+
+
+class _FailingZlib:
+    """Stand-in for the zlib module whose decompressors raise a given error."""
+
+    error = uni_gzip_module._zlib.error
+
+    def __init__(self, exception):
+        self.exception = exception
+
+    def decompressobj(self, wbits):
+        return self
+
+    eof = False
+
+    def decompress(self, data):
+        raise self.exception
+
+
+@pytest.mark.parametrize("error", [MemoryError(), KeyboardInterrupt()], ids=["MemoryError", "KeyboardInterrupt"])
+def test_inflate_error_is_not_hidden_by_mmap_close(tmp_path, monkeypatch, error):
+    path = tmp_path / "large.gz"
+    path.write_bytes(gzip.compress(_large_payload(), compresslevel=1))
+    assert path.stat().st_size > uni_gzip_module._SMALL_FILE_SIZE
+    monkeypatch.setattr(uni_gzip_module, "_zlib", _FailingZlib(error))
+
+    if isinstance(error, Exception):
+        with pytest.raises(UniGzipTxtReadError) as exc_info:
+            readTxtGzBytes(path)
+        assert exc_info.value.__cause__ is error
+    else:
+        with pytest.raises(KeyboardInterrupt):
+            readTxtGzBytes(path)
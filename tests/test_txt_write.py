@@ -0,0 +1,67 @@
+"""
+Tests for the content types accepted by writeTxtGz and compressTxt.
+"""
+
+import gzip
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+from uni_gzip import compressTxt, readTxtGz, writeTxtGz
+
+LINES = [f"line {i} é\n" for i in range(1000)]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["".join(LINES), LINES, tuple(LINES), (line for line in LINES), iter(LINES)],
+    ids=["str", "list", "tuple", "generator", "iterator"],
+)
+def test_content_types(tmp_path, content):
+    path = tmp_path / "data.txt.gz"
+    writeTxtGz(path, content)
+    assert readTxtGz(path) == "".join(LINES)
+
+
+@pytest.mark.parametrize("content", [[], (), iter([]), ""], ids=["list", "tuple", "iterator", "str"])
+def test_empty_content(tmp_path, content):
+    path = tmp_path / "empty.txt.gz"
+    writeTxtGz(path, content)
+    assert readTxtGz(path) == ""
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 1024 * 1024])
+def test_iterable_batches(tmp_path, monkeypatch, batch_size):
+    monkeypatch.setattr(uni_gzip_module, "_WRITE_BATCH_SIZE", batch_size)
+    # Over 2 MiB of encoded text, so the default batch size is crossed as well
+    lines = [f"{i:08d} {'é' * 20}\n" for i in range(50000)]
+    path = tmp_path / "batched.txt.gz"
+    writeTxtGz(path, (line for line in lines))
+
+    assert readTxtGz(path) == "".join(lines)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [["a", 1], ("a", None), ["a", b"b"], (item for item in ["a", 2]), b"bytes", 42, None],
+    ids=["list-int", "tuple-none", "list-bytes", "generator-int", "bytes", "int", "none"],
+)
+def test_invalid_content_raises_type_error(tmp_path, content):
+    with pytest.raises(TypeError, match="content must be a string or iterable of strings"):
+        writeTxtGz(tmp_path / "bad.txt.gz", content)
+
+
+def test_invalid_element_after_first_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(uni_gzip_module, "_WRITE_BATCH_SIZE", 4)
+
+    def lines():
+        yield from ["first\n", "second\n"]
+        yield 3
+
+    with pytest.raises(TypeError, match="content must be a string or iterable of strings"):
+        writeTxtGz(tmp_path / "bad.txt.gz", lines())
+
+
+@pytest.mark.parametrize("content", ["".join(LINES), LINES, tuple(LINES), iter(LINES)], ids=["str", "list", "tuple", "iterator"])
+def test_compress_txt(content):
+    assert gzip.decompress(compressTxt(content)).decode("utf-8") == "".join(LINES)
@@ -0,0 +1,162 @@
+"""
+Tests for reading with verify_checksum=False and its gzip header parser.
+"""
+
+import gzip
+import struct
+import zlib
+
+import pytest
+
+import uni_gzip.uni_gzip as uni_gzip_module
+from uni_gzip import UniGzipTxtReadError, readJsonGz, readTxtGz, readTxtGzBytes
+
+PAYLOAD = b'{"message":"hello world","values":[1,2,3]}'
+
+
+def _header(flags: int = 0, extra: bytes = b"x" * 5, name: bytes = b"data.json", comment: bytes = b"a comment") -> bytes:
+    """Build a gzip member header with the requested optional fields."""
+    header = b"\x1f\x8b\x08" + bytes([flags]) + b"\0\0\0\0" + b"\0\xff"
+    if flags & gzip.FEXTRA:
+        header += struct.pack("<H", len(extra)) + extra
+    if flags & gzip.FNAME:
+        header += name + b"\0"
+    if flags & gzip.FCOMMENT:
+        header += comment + b"\0"
+    if flags & gzip.FHCRC:
+        header += struct.pack("<H", zlib.crc32(header) & 0xFFFF)
+    return header
+
+
+def _member(payload: bytes = PAYLOAD, flags: int = 0, **fields) -> bytes:
+    """Build one gzip member around a raw deflate stream of ``payload``."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+    body = compressor.compress(payload) + compressor.flush()
+    return _header(flags, **fields) + body + struct.pack("<II", zlib.crc32(payload), len(payload) & 0xFFFFFFFF)
+
+
+def _corrupt_crc(member: bytes) -> bytes:
+    return member[:-8] + bytes(b ^ 0xFF for b in member[-8:-4]) + member[-4:]
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [0, gzip.FTEXT, gzip.FEXTRA, gzip.FNAME, gzip.FCOMMENT, gzip.FHCRC, gzip.FEXTRA | gzip.FNAME | gzip.FCOMMENT | gzip.FHCRC],
+    ids=["none", "ftext", "fextra", "fname", "fcomment", "fhcrc", "all"],
+)
+def test_header_flags(tmp_path, fallback_calls, flags):
+    member = _member(flags=flags)
+    assert uni_gzip_module._gzip_header_size(member) == len(_header(flags))
+
+    path = tmp_path / "data.json.gz"
+    path.write_bytes(member)
+    for verify_checksum in (True, False):
+        assert readTxtGzBytes(path, verify_checksum=verify_checksum) == PAYLOAD
+    assert readJsonGz(path, verify_checksum=False) == {"message": "hello world", "values": [1, 2, 3]}
+    assert fallback_calls == []
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        b"",
+        b"\x1f\x8b",
+        b"\x1f\x8b\x08\x00\0\0\0\0\0",
+        b"\x1f\x8b\x09\x00\0\0\0\0\0\xff",
+        b"\x1f\x8b\x08" + bytes([gzip.FEXTRA]) + b"\0\0\0\0\0\xff" + b"\x10\x00abc",
+        b"\x1f\x8b\x08" + bytes([gzip.FNAME]) + b"\0\0\0\0\0\xff" + b"unterminated",
+        b"\x1f\x8b\x08" + bytes([gzip.FCOMMENT]) + b"\0\0\0\0\0\xff" + b"unterminated",
+        b"\x1f\x8b\x08" + bytes([gzip.FHCRC]) + b"\0\0\0\0\0\xff" + b"\x00",
+    ],
+    ids=["empty", "magic-only", "short-fixed", "bad-method", "short-extra", "open-name", "open-comment", "short-hcrc"],
+)
+def test_invalid_or_truncated_header(tmp_path, header):
+    assert uni_gzip_module._gzip_header_size(header) is None
+
+    path = tmp_path / "bad.gz"
+    path.write_bytes(header)
+    if header:
+        with pytest.raises(UniGzipTxtReadError):
+            readTxtGzBytes(path, verify_checksum=False)
+
+
+def test_header_longer_than_limit_falls_back_and_verifies(tmp_path, fallback_calls):
+    long_name = b"n" * (uni_gzip_module._MAX_HEADER_SIZE + 1)
+    member = _member(flags=gzip.FNAME, name=long_name)
+    assert uni_gzip_module._gzip_header_size(member) is None
+
+    path = tmp_path / "long.gz"
+    path.write_bytes(member)
+    assert readTxtGzBytes(path, verify_checksum=False) == PAYLOAD
+    assert fallback_calls == [str(path)]
+
+    # The GzipFile fallback always verifies, even with verify_checksum=False
+    path.write_bytes(_corrupt_crc(member))
+    with pytest.raises(UniGzipTxtReadError):
+        readTxtGzBytes(path, verify_checksum=False)
+
+
+def test_corrupted_crc(tmp_path):
+    path = tmp_path / "crc.gz"
+    path.write_bytes(_corrupt_crc(_member()))
+
+    with pytest.raises(UniGzipTxtReadError):
+        readTxtGzBytes(path)
+    with pytest.raises(UniGzipTxtReadError):
+        readTxtGz(path)
+    assert readTxtGzBytes(path, verify_checksum=False) == PAYLOAD
+    assert readTxtGz(path, verify_checksum=False) == PAYLOAD.decode("utf-8")
+
+
+def test_truncated_trailer(tmp_path):
+    path = tmp_path / "trailer.gz"
+    path.write_bytes(_member()[:-3])
+
+    for verify_checksum in (True, False):
+        with pytest.raises(UniGzipTxtReadError):
+            readTxtGzBytes(path, verify_checksum=verify_checksum)
+
+
+def test_trailing_padding(tmp_path, fallback_calls):
+    path = tmp_path / "padded.gz"
+    path.write_bytes(_member(flags=gzip.FNAME) + b"\0" * 100)
+
+    for verify_checksum in (True, False):
+        assert readTxtGzBytes(path, verify_checksum=verify_checksum) == PAYLOAD
+    assert fallback_calls == []
+
+
+def test_trailing_garbage_raises(tmp_path):
+    path = tmp_path / "garbage.gz"
+    path.write_bytes(_member() + b"garbage!!!")
+
+    for verify_checksum in (True, False):
+        with pytest.raises(UniGzipTxtReadError):
+            readTxtGzBytes(path, verify_checksum=verify_checksum)
+
+
+def test_multi_member(tmp_path, fallback_calls):
+    path = tmp_path / "multi.gz"
+    path.write_bytes(_member(b"first ", flags=gzip.FNAME) + _member(b"second", flags=gzip.FEXTRA | gzip.FHCRC))
+
+    for verify_checksum in (True, False):
+        assert readTxtGzBytes(path, verify_checksum=verify_checksum) == b"first second"
+    assert fallback_calls == []
+
+
+def test_multi_member_with_corrupted_crc(tmp_path):
+    path = tmp_path / "multi-crc.gz"
+    path.write_bytes(_member(b"first ") + _corrupt_crc(_member(b"second")))
+
+    with pytest.raises(UniGzipTxtReadError):
+        readTxtGzBytes(path)
+    assert readTxtGzBytes(path, verify_checksum=False) == b"first second"
+
+
+def test_multi_member_with_unparseable_second_header_falls_back(tmp_path, fallback_calls):
+    long_name = b"n" * (uni_gzip_module._MAX_HEADER_SIZE + 1)
+    path = tmp_path / "multi-long.gz"
+    path.write_bytes(_member(b"first ") + _member(b"second", flags=gzip.FNAME, name=long_name))
+
+    assert readTxtGzBytes(path, verify_checksum=False) == b"first second"
+    assert fallback_calls == [str(path)]
@@ -0,0 +1,113 @@
+"""
+Tests for the optional write behaviors of the writer functions.
+"""
+
+import os
+import random
+
+import pytest
+
+from uni_gzip import readJsonGz, readTxtGz, writeJsonArchive, writeJsonGz, writeJsonGzFromBytes, writeJsonGzMany, writeTxtGz
+
+SMALL_DATA = {"values": list(range(1000))}
+# Serializes to well over 1 MiB, so threads > 1 takes the parallel compression path
+LARGE_DATA = {"values": list(range(300000))}
+
+
+@pytest.fixture
+def sync_calls(monkeypatch):
+    """Record fdatasync and POSIX_FADV_DONTNEED calls, in order, while still making them."""
+    if not hasattr(os, "posix_fadvise"):
+        pytest.skip("requires os.posix_fadvise")
+    calls = []
+    fdatasync = os.fdatasync
+    posix_fadvise = os.posix_fadvise
+
+    def fdatasync_spy(fd):
+        calls.append(("fdatasync", fd))
+        fdatasync(fd)
+
+    def posix_fadvise_spy(fd, offset, length, advice):
+        if advice == os.POSIX_FADV_DONTNEED:
+            calls.append(("dontneed", fd))
+        posix_fadvise(fd, offset, length, advice)
+
+    monkeypatch.setattr(os, "fdatasync", fdatasync_spy)
+    monkeypatch.setattr(os, "posix_fadvise", posix_fadvise_spy)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "write, read, expected",
+    [
+        (lambda path: writeJsonGz(path, SMALL_DATA, drop_cache=True), readJsonGz, SMALL_DATA),
+        (lambda path: writeJsonGz(path, LARGE_DATA, threads=2, drop_cache=True), readJsonGz, LARGE_DATA),
+        (lambda path: writeJsonGzFromBytes(path, b'{"k":1}', drop_cache=True), readJsonGz, {"k": 1}),
+        (lambda path: writeJsonGzMany([(path, SMALL_DATA)], drop_cache=True), readJsonGz, SMALL_DATA),
+        (lambda path: writeJsonGzMany([(path, LARGE_DATA)], drop_cache=True, threads=2), readJsonGz, LARGE_DATA),
+        (lambda path: writeTxtGz(path, "text", drop_cache=True), readTxtGz, "text"),
+        (lambda path: writeTxtGz(path, ["a\n", "b\n"], drop_cache=True), readTxtGz, "a\nb\n"),
+        (lambda path: writeTxtGz(path, (line for line in ["a\n", "b\n"]), drop_cache=True), readTxtGz, "a\nb\n"),
+    ],
+    ids=["json", "json-threads", "json-bytes", "json-many", "json-many-threads", "txt", "txt-list", "txt-iterable"],
+)
+def test_drop_cache_syncs_then_evicts(tmp_path, sync_calls, write, read, expected):
+    path = tmp_path / "data.gz"
+    write(path)
+
+    assert len(sync_calls) == 2
+    (first, first_fd), (second, second_fd) = sync_calls
+    assert (first, second) == ("fdatasync", "dontneed")
+    assert first_fd == second_fd
+    assert read(path) == expected
+
+
+def test_no_drop_cache_by_default(tmp_path, sync_calls):
+    writeJsonGz(tmp_path / "a.json.gz", LARGE_DATA, threads=2)
+    writeTxtGz(tmp_path / "b.txt.gz", (line for line in ["a\n"]))
+    assert sync_calls == []
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda path, text, level: writeJsonGz(path, text, compresslevel=level),
+        lambda path, text, level: writeJsonGzFromBytes(path, text.encode("utf-8"), compresslevel=level),
+        lambda path, text, level: writeJsonGzMany([(path, text)], compresslevel=level),
+        lambda path, text, level: writeJsonArchive(path, text, compresslevel=level),
+        lambda path, text, level: writeTxtGz(path, text, compresslevel=level),
+        lambda path, text, level: writeTxtGz(path, iter([text]), compresslevel=level),
+    ],
+    ids=["json", "json-bytes", "json-many", "archive", "txt", "txt-iterable"],
+)
+def test_compresslevel_is_passed_through(tmp_path, write):
+    rng = random.Random(0)
+    text = " ".join(rng.choice(["alpha", "beta", "gamma", "delta", "epsilon"]) + str(rng.randrange(1000)) for _ in range(50000))
+    sizes = {}
+    for level in (0, 1, 9):
+        path = tmp_path / f"level{level}.json.gz"
+        write(path, text, level)
+        sizes[level] = path.stat().st_size
+    # Level 0 only stores the data; level 9 searches harder than level 1
+    assert sizes[0] > len(text) > sizes[1] > sizes[9]
+
+
+@pytest.mark.parametrize("compresslevel", [-1, 10])
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda path, level: writeJsonGz(path, {"a": 1}, compresslevel=level),
+        lambda path, level: writeJsonGz(path, LARGE_DATA, compresslevel=level, threads=2),
+        lambda path, level: writeJsonGzFromBytes(path, b"{}", compresslevel=level),
+        lambda path, level: writeJsonGzMany([(path, {"a": 1})], compresslevel=level),
+        lambda path, level: writeJsonArchive(path, {"a": 1}, compresslevel=level),
+        lambda path, level: writeTxtGz(path, "text", compresslevel=level),
+        lambda path, level: writeTxtGz(path, iter(["text"]), compresslevel=level),
+    ],
+    ids=["json", "json-threads", "json-bytes", "json-many", "archive", "txt", "txt-iterable"],
+)
+def test_invalid_compresslevel(tmp_path, write, compresslevel):
+    path = tmp_path / "data.gz"
+    with pytest.raises(ValueError, match="compresslevel must be from 0 to 9"):
+        write(path, compresslevel)
+    assert not path.exists()